@@ -0,0 +1,132 @@
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+DATA_PATH = '../../../data/fashion/'
+
+VAL_FRAC = 0.01
+TEST_FRAC = 0.01
+
+SPLITS_CSV = 'splits.csv'
+SPLITS = ['train', 'val', 'test']
+
+# fixed key, so that the hash of a product id never changes between runs or machines
+HASH_KEY = '0123456789123456'
+GROUP_COLUMNS = ['category', 'color']
+
+
+def hash_ids(ids):
+    """
+    Map each product id to a stable hash.
+    :param ids: series of product ids
+    :return: array of unsigned integers, one per id
+    """
+
+    return pd.util.hash_pandas_object(ids.astype(str), index=False, hash_key=HASH_KEY).values
+
+
+def split_quota(group_size, frac):
+    """
+    Get the number of products of each group that go to a split. Each group gets the rounded down fraction
+    of its size, and the groups with the largest remainders get one product more, until the split has the
+    given fraction of all products. Groups too small for a whole product mostly stay in train entirely.
+    :param group_size: series with the number of products in each group
+    :param frac: fraction of products to put in the split
+    :return: series with the number of products of each group in the split
+    """
+
+    exact = group_size * frac
+    quota = np.floor(exact)
+
+    n_extra = int(round(exact.sum())) - int(quota.sum())
+    remainder = (exact - quota).sort_values(ascending=False, kind='mergesort')
+    quota[remainder.index[:n_extra]] += 1
+
+    return quota
+
+
+def assign_splits(df, df_splits, val_frac, test_frac):
+    """
+    Assign the products without a split to the train, validation or test split, stratified by category and color.
+    Each (category, color) group gets its share of test and validation products from split_quota. The products
+    already assigned count towards that, and the remaining places go to the new products with the lowest id hash
+    in the group, so the result is reproducible. A product listed in several categories is assigned once,
+    in the group of its first row.
+    :param df: products with their id, category and color
+    :param df_splits: existing assignment with the id and split of each product
+    :param val_frac: fraction of products to put in the validation set
+    :param test_frac: fraction of products to put in the test set
+    :return: dataframe with the id and split of each new product
+    """
+
+    df = df.drop_duplicates('id')[['id'] + GROUP_COLUMNS].fillna('')
+    df = df.merge(df_splits, on='id', how='left')
+
+    group_size = df.groupby(GROUP_COLUMNS).size()
+    places_left = pd.DataFrame(index=group_size.index)
+    for split, frac in [('test', test_frac), ('val', val_frac)]:
+        assigned = df[df.split == split].groupby(GROUP_COLUMNS).size().reindex(group_size.index, fill_value=0)
+        places_left[split] = (split_quota(group_size, frac) - assigned).clip(lower=0)
+
+    # rank the new products by their id hash within each group
+    df_new = df.loc[df.split.isnull(), ['id'] + GROUP_COLUMNS]
+    df_new['hash'] = hash_ids(df_new.id)
+    df_new = df_new.sort_values('hash')
+    rank = df_new.groupby(GROUP_COLUMNS).cumcount()
+
+    places_left = df_new.join(places_left, on=GROUP_COLUMNS)
+    df_new['split'] = np.select([rank < places_left.test, rank < places_left.test + places_left.val],
+                                ['test', 'val'],
+                                default='train')
+
+    return df_new[['id', 'split']]
+
+
+def split_dataset(data_path, val_frac, test_frac):
+    """
+    Split the products in data.csv into train, validation and test sets. The assignment of each
+    product is stored in splits.csv, so on the next run only newly scraped products are assigned
+    and the existing ones keep their split. For each split a csv file with the list of its image
+    paths is written next to the dataset.
+    :param data_path: folder with the data.csv file
+    :param val_frac: fraction of products to put in the validation set
+    :param test_frac: fraction of products to put in the test set
+    """
+
+    df = pd.read_csv(os.path.join(data_path, 'data.csv'), sep=';', encoding='utf-8', dtype={'id': str})
+
+    splits_csv = os.path.join(data_path, SPLITS_CSV)
+    if os.path.exists(splits_csv):
+        df_splits = pd.read_csv(splits_csv, sep=';', encoding='utf-8', dtype={'id': str})
+    else:
+        df_splits = pd.DataFrame(columns=['id', 'split'])
+
+    # only products without a split yet are assigned one
+    df_new = assign_splits(df, df_splits, val_frac, test_frac)
+    print('Assigning {} new products'.format(len(df_new)))
+
+    if len(df_new) > 0:
+        df_splits = pd.concat([df_splits, df_new], ignore_index=True)
+        df_splits.to_csv(splits_csv, index=False, sep=';', encoding='utf-8')
+
+    df = df.merge(df_splits, on='id', how='left')
+
+    for split in SPLITS:
+        split_imgs = df.loc[df.split == split, 'img_path']
+        split_imgs.to_csv(os.path.join(data_path, '{}_imgs.csv'.format(split)), index=False, header=False)
+        print('{}: {} images'.format(split, len(split_imgs)))
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--data_path', type=str, default=DATA_PATH,
+                        help='folder with the data.csv file, the split files are saved there as well')
+    parser.add_argument('--val_frac', type=float, default=VAL_FRAC)
+    parser.add_argument('--test_frac', type=float, default=TEST_FRAC)
+
+    config = parser.parse_args()
+    print(config)
+    split_dataset(config.data_path, config.val_frac, config.test_frac)
@@ -0,0 +1,236 @@
+import os
+import argparse
+import sqlite3
+import hashlib
+import pandas as pd
+
+DATA_PATH = '../../../data/'
+MERGED_FOLDER = 'fashion'
+WEBSITES = ['aboutyou', 'fashionid', 'zalando']
+
+CHUNK_SIZE = 5000
+CHECKSUM_BLOCK_SIZE = 1024 * 1024
+INDEX_DB = 'merge_index.db'
+
+# unified schema of the merged catalog, columns missing for a website are left empty
+COLUMNS = ['id', 'name', 'brand', 'img_url', 'product_url', 'model_img_urls', 'attributes',
+           'img_path', 'category', 'color', 'website']
+
+
+def open_index(index_path):
+    """
+    Open the merge index, which keeps all the merged product ids with the path mapping of their images,
+    the number of rows already merged from each website and a checksum of the website's data.csv they were read from.
+    :param index_path: path to the sqlite file
+    :return: sqlite connection
+    """
+
+    conn = sqlite3.connect(index_path)
+    conn.execute('CREATE TABLE IF NOT EXISTS products '
+                 '(id TEXT PRIMARY KEY, website TEXT, src_img_path TEXT, img_path TEXT)')
+    conn.execute('CREATE TABLE IF NOT EXISTS websites '
+                 '(website TEXT PRIMARY KEY, rows INTEGER, size INTEGER, checksum TEXT)')
+    conn.execute('CREATE TABLE IF NOT EXISTS catalog (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER)')
+    conn.execute('CREATE TEMP TABLE chunk_ids (id TEXT PRIMARY KEY)')
+    return conn
+
+
+def get_file_checksum(file_path, size):
+    """
+    Get the checksum of the first bytes of the file, read in blocks.
+    :param file_path: path to the file
+    :param size: number of bytes to read
+    :return: sha1 hex digest
+    """
+
+    sha1 = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        while size > 0:
+            block = f.read(min(CHECKSUM_BLOCK_SIZE, size))
+            if not block:
+                break
+            sha1.update(block)
+            size -= len(block)
+
+    return sha1.hexdigest()
+
+
+def get_merged_rows(conn, website, website_csv):
+    """
+    Get the number of rows of the website's data.csv that were already merged. The rows can only be skipped
+    if the part of the file seen by the last merge is unchanged. If the file was rewritten since, e.g. by the
+    data cleaning, all its rows have to be read again; the products already merged are still skipped by id.
+    """
+
+    row = conn.execute('SELECT rows, size, checksum FROM websites WHERE website = ?', (website,)).fetchone()
+    if row is None:
+        return 0
+
+    merged_rows, size, checksum = row
+    if size is None or os.path.getsize(website_csv) < size or get_file_checksum(website_csv, size) != checksum:
+        print('{}: data.csv changed since the last merge, reading all rows'.format(website))
+        return 0
+
+    return merged_rows
+
+
+def get_catalog_size(conn):
+    """
+    Get the size in bytes of the merged data.csv after the last chunk recorded in the index.
+    """
+
+    row = conn.execute('SELECT size FROM catalog WHERE id = 0').fetchone()
+    return row[0] if row else None
+
+
+def rollback_catalog(conn, merged_csv):
+    """
+    Truncate the merged data.csv to the size recorded in the index. This drops the rows of a chunk
+    that was appended when the merge was interrupted before the chunk was recorded in the index.
+    If no chunk was recorded yet, the whole file is dropped.
+    """
+
+    catalog_size = get_catalog_size(conn) or 0
+    if os.path.exists(merged_csv) and os.path.getsize(merged_csv) > catalog_size:
+        print('Removing rows not recorded in the index from: {}'.format(merged_csv))
+        with open(merged_csv, 'r+b') as f:
+            f.truncate(catalog_size)
+
+
+def get_existing_ids(conn, ids):
+    """
+    Get the ids from the given list that are already in the merged catalog.
+    """
+
+    conn.execute('DELETE FROM chunk_ids')
+    conn.executemany('INSERT OR IGNORE INTO chunk_ids VALUES (?)', ((product_id,) for product_id in ids))
+    return {row[0] for row in conn.execute('SELECT id FROM chunk_ids JOIN products USING (id)')}
+
+
+def link_image(src_path, dst_path):
+    """
+    Hardlink the image into the merged folder instead of copying its bytes.
+    :return: True if the image is available at the destination path
+    """
+
+    if os.path.exists(dst_path):
+        return True
+
+    dst_folder = os.path.dirname(dst_path)
+    if not os.path.exists(dst_folder):
+        os.makedirs(dst_folder)
+
+    try:
+        os.link(src_path, dst_path)
+        return True
+    except OSError as e:
+        print('Problem with linking image: {}'.format(src_path), e)
+        return False
+
+
+def merge_website(conn, data_path, merged_path, website, chunk_size, link_imgs):
+    """
+    Stream the new rows of the website's data.csv into the merged data.csv in chunks. Products whose id
+    is already in the catalog are skipped, so the first website listing a product wins.
+    :param conn: connection to the merge index
+    :param data_path: folder with the scraped data of all websites
+    :param merged_path: folder of the merged catalog
+    :param website: name of the website folder
+    :param chunk_size: number of rows to read at once
+    :param link_imgs: hardlink images into the merged folder, otherwise the rows point to the original images
+    """
+
+    website_csv = os.path.join(data_path, website, 'data.csv')
+    merged_csv = os.path.join(merged_path, 'data.csv')
+
+    if not os.path.exists(website_csv):
+        print('No data found for website: {}'.format(website))
+        return
+
+    # rows merged before are skipped, as long as data.csv was only appended to since
+    merged_rows = get_merged_rows(conn, website, website_csv)
+    reader = pd.read_csv(website_csv, sep=';', encoding='utf-8', dtype={'id': str},
+                         skiprows=range(1, merged_rows + 1), chunksize=chunk_size)
+
+    n_new = 0
+    for chunk in reader:
+        n_rows = len(chunk)
+
+        chunk['website'] = website
+        chunk = chunk.reindex(columns=COLUMNS, fill_value='')
+        chunk = chunk.drop_duplicates('id')
+        chunk = chunk[~chunk.id.isin(get_existing_ids(conn, chunk.id))].copy()
+
+        src_img_paths = [os.path.join(data_path, website, img_path) for img_path in chunk.img_path]
+        img_paths = chunk.category + '/' + chunk.id + '.jpg'
+
+        # rows whose image is not linked point to the original image, relative to the merged folder
+        chunk['img_path'] = [img_path if link_imgs and link_image(src_path, os.path.join(merged_path, img_path))
+                             else os.path.relpath(src_path, merged_path)
+                             for src_path, img_path in zip(src_img_paths, img_paths)]
+
+        chunk.to_csv(merged_csv, mode='a', header=not os.path.exists(merged_csv) or os.path.getsize(merged_csv) == 0,
+                     index=False, sep=';', encoding='utf-8')
+
+        # the chunk only counts as merged once it is recorded in the index
+        with conn:
+            conn.executemany('INSERT INTO products VALUES (?, ?, ?, ?)',
+                             zip(chunk.id, chunk.website, src_img_paths, chunk.img_path))
+            merged_rows += n_rows
+            conn.execute('INSERT OR IGNORE INTO websites (website) VALUES (?)', (website,))
+            conn.execute('UPDATE websites SET rows = ? WHERE website = ?', (merged_rows, website))
+            conn.execute('INSERT OR REPLACE INTO catalog VALUES (0, ?)', (os.path.getsize(merged_csv),))
+
+        n_new += len(chunk)
+
+    # remember the file the rows were read from, to detect when it is rewritten
+    size = os.path.getsize(website_csv)
+    with conn:
+        conn.execute('INSERT OR IGNORE INTO websites (website) VALUES (?)', (website,))
+        conn.execute('UPDATE websites SET rows = ?, size = ?, checksum = ? WHERE website = ?',
+                     (merged_rows, size, get_file_checksum(website_csv, size), website))
+
+    print('{}: merged {} new products'.format(website, n_new))
+
+
+def merge_datasets(data_path, websites, chunk_size, link_imgs):
+    """
+    Merge the scraped data of the given websites into one catalog in the merged folder.
+    :param data_path: folder with the scraped data of all websites
+    :param websites: list of website folders to merge
+    :param chunk_size: number of rows to read at once
+    :param link_imgs: hardlink images into the merged folder, otherwise the rows point to the original images
+    """
+
+    merged_path = os.path.join(data_path, MERGED_FOLDER)
+    if not os.path.exists(merged_path):
+        os.makedirs(merged_path)
+
+    conn = open_index(os.path.join(merged_path, INDEX_DB))
+    try:
+        rollback_catalog(conn, os.path.join(merged_path, 'data.csv'))
+        for website in websites:
+            merge_website(conn, data_path, merged_path, website, chunk_size, link_imgs)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--data_path', type=str, default=DATA_PATH,
+                        help='folder with the scraped data of each website, the merged data is saved in its '
+                             '"{}" subfolder'.format(MERGED_FOLDER))
+    parser.add_argument("--websites", required=False, type=str, default=','.join(WEBSITES),
+                        help="comma separated list of websites to merge, e.g.: aboutyou,zalando")
+    parser.add_argument('--chunk_size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--link', dest='link_imgs', action='store_true')
+    parser.add_argument('--no_link', dest='link_imgs', action='store_false')
+    parser.set_defaults(link_imgs=True)
+
+    config = parser.parse_args()
+    print(config)
+
+    websites = [str(item) for item in config.websites.split(',')]
+    merge_datasets(config.data_path, websites, config.chunk_size, config.link_imgs)
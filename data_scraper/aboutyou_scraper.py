@@ -1,6 +1,5 @@
 from scraper import Scraper
 from bs4 import BeautifulSoup
-from selenium import webdriver
 
 
 class AboutYouScraper(Scraper):
@@ -38,12 +37,14 @@ class AboutYouScraper(Scraper):
                  img_width,
                  download_imgs,
                  color_names=list(COLORS.keys()),
-                 categories=CATEGORIES):
+                 categories=CATEGORIES,
+                 image_store_path=None):
         """
         :param data_path: path where to save the scraped data
         :param chromedriver_path: path to chromedriver
         :param color_names: list of color names to scrape (optional)
         :param categories: list of categories to scrape (optional)
+        :param image_store_path: path of the image store, by default in the data path (optional)
         :param img_format: format in which scraped images should be saved
         """
 
@@ -55,7 +56,7 @@ class AboutYouScraper(Scraper):
 
         self.chromedriver_path = chromedriver_path
 
-        super().__init__(data_path, img_width, colors, categories, download_imgs)
+        super().__init__(data_path, img_width, colors, categories, download_imgs, image_store_path)
 
     def get_number_of_pages(self, url):
         """
@@ -75,45 +76,57 @@ class AboutYouScraper(Scraper):
 
         return max_page
 
+    def get_product_record(self, product):
+        """
+        Get the information of the product that is available on the category page.
+        :param product: html object from the products_soup
+        :return: link, brand, name and main image url of the product
+        """
+
+        product_img_link = product.find('div', class_='styles__img--R5yfd styles__imgTrimmed--1j_b9')['style']
+        product_img_link = 'https:' + product_img_link.split('(')[1].split('?')[0].replace('"', '')
+
+        return {'link': self.url + product.a['href'],
+                'brand': product.find('div', class_='styles__brandName--2XS22').text,
+                'name': product.find('div', class_='styles__productName--2z0ZU').text,
+                'img_url': product_img_link}
+
     def get_product_info(self, product):
         """
         Get all the information of the product, such as description, name and url to the image.
-        :param product: html object from the product_soup
+        :param product: product record from the category page
         :return: name of the product, unique image ID, url to the image, image tags
         """
 
-        product_link = self.url + product.a['href']
-        product_brand = product.find('div', class_='styles__brandName--2XS22').text
-        product_name = product.find('div', class_='styles__productName--2z0ZU').text
+        product_link = product['link']
+        product_img_link = product['img_url']
 
         product_page = self.get_response(product_link)
         product_soup = BeautifulSoup(product_page.content, 'html.parser')
 
-        # get product details
-        product_id = product_soup.find('li', class_='styles__articleNumber--1UszN').text.split(':')[-1].strip()
-        product_details = product_soup.find('div', class_='col-sm-6 styles__detailsContainer--1ku-C')
-        product_attributes = []
-        for detail_section in product_details.find_all('div', class_='styles__accordionContainer--1dPP0'):
-            for tag in detail_section.find_all('li'):
-                product_attributes.append(tag.text.strip())
-
-        # product images
-        # main product image
-        product_img_link = product.find('div', class_='styles__img--R5yfd styles__imgTrimmed--1j_b9')['style']
-        product_img_link = 'https:' + product_img_link.split('(')[1].split('?')[0].replace('"', '')
-
-        # model images
-        product_img_thumbs = product_soup.find('div', class_='styles__images--wD0M5').find('div', class_='slider')
-        product_img_thumbs = product_img_thumbs.find_all('div', class_='styles__img--R5yfd')
-
-        img_links = []
-        for img_thumb in product_img_thumbs:
-            img_link = 'https:' + img_thumb['style'].split('(')[1].split('?')[0]
-            img_links.append(img_link)
-        img_links.remove(product_img_link)
-
-        return {'name': product_name,
-                'brand': product_brand,
+        try:
+            # get product details
+            product_id = product_soup.find('li', class_='styles__articleNumber--1UszN').text.split(':')[-1].strip()
+            product_details = product_soup.find('div', class_='col-sm-6 styles__detailsContainer--1ku-C')
+            product_attributes = []
+            for detail_section in product_details.find_all('div', class_='styles__accordionContainer--1dPP0'):
+                for tag in detail_section.find_all('li'):
+                    product_attributes.append(tag.text.strip())
+
+            # model images
+            product_img_thumbs = product_soup.find('div', class_='styles__images--wD0M5').find('div', class_='slider')
+            product_img_thumbs = product_img_thumbs.find_all('div', class_='styles__img--R5yfd')
+
+            img_links = []
+            for img_thumb in product_img_thumbs:
+                img_link = 'https:' + img_thumb['style'].split('(')[1].split('?')[0]
+                img_links.append(img_link)
+            img_links.remove(product_img_link)
+        finally:
+            self.release_soup(product_soup)
+
+        return {'name': product['name'],
+                'brand': product['brand'],
                 'id': product_id,
                 'img_url': product_img_link,
                 'product_url': product_link,
@@ -123,11 +136,14 @@ class AboutYouScraper(Scraper):
 
     def download_products(self, url):
         """
-        Download all the product html from the category page
+        Download the category page and yield the record of each product on it. The page html is
+        decomposed before the first record is yielded.
         :param url: URL to the category website
-        :return: HTML for all the products on the website
+        :return: generator of product records
         """
-        products = []
+        from selenium import webdriver
+
+        records = []
 
         # start driver to click on Produktansicht button
         driver = webdriver.Chrome(self.chromedriver_path)
@@ -151,9 +167,13 @@ class AboutYouScraper(Scraper):
                 subcat_soup = BeautifulSoup(driver.page_source, 'html.parser')
                 driver.close()
 
-                # avoid taking 'Weitere Produkte' section, which are products that don't match the filter
-                color_products = subcat_soup.find('div', class_='styles__container--1bqmB')
-                products = color_products.find_all('div', class_='styles__tile--2s8XN col-sm-6 col-md-4 col-lg-4')
+                try:
+                    # avoid taking 'Weitere Produkte' section, which are products that don't match the filter
+                    color_products = subcat_soup.find('div', class_='styles__container--1bqmB')
+                    products = color_products.find_all('div', class_='styles__tile--2s8XN col-sm-6 col-md-4 col-lg-4')
+                    records = self.get_product_records(products)
+                finally:
+                    self.release_soup(subcat_soup)
             else:
                 driver.close()
                 print('No products found')
@@ -162,6 +182,4 @@ class AboutYouScraper(Scraper):
             print('Problem with downloading products at {}:'.format(url), e)
             driver.close()
 
-        return products
-
-
+        yield from records
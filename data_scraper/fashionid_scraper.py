@@ -35,11 +35,13 @@ class FashionIdScraper(Scraper):
                  img_width,
                  download_imgs,
                  color_names=list(COLORS.keys()),
-                 categories=CATEGORIES):
+                 categories=CATEGORIES,
+                 image_store_path=None):
         """
         :param data_path: path where to save the scraped data
         :param color_names: list of color names to scrape (optional)
         :param categories: list of categories to scrape (optional)
+        :param image_store_path: path of the image store, by default in the data path (optional)
         :param img_format: format in which scraped images should be saved
         """
 
@@ -49,7 +51,7 @@ class FashionIdScraper(Scraper):
         colors = {color_name: self.COLORS[color_name] for color_name in color_names}
         categories = categories
 
-        super().__init__(data_path, img_width, colors, categories, download_imgs)
+        super().__init__(data_path, img_width, colors, categories, download_imgs, image_store_path)
 
     def get_number_of_pages(self, url):
         """
@@ -69,40 +71,52 @@ class FashionIdScraper(Scraper):
 
         return max_page
 
+    def get_product_record(self, product):
+        """
+        Get the information of the product that is available on the category page.
+        :param product: html object from the products_soup
+        :return: link, brand and name of the product
+        """
+
+        return {'link': self.url + product.a['href'],
+                'brand': product.find('div', class_='product-item__brand qa-product-tile-brand').text,
+                'name': product.find('h3', class_='product-item__description').find(text=True, recursive=False).strip()}
+
     def get_product_info(self, product):
         """
         Get all the information of the product, such as description, name and url to the image.
-        :param product: html object from the product_soup
+        :param product: product record from the category page
         :return: name of the product, unique image ID, url to the image, image tags
         """
 
-        product_link = self.url + product.a['href']
-        product_brand = product.find('div', class_='product-item__brand qa-product-tile-brand').text
-        product_name = product.find('h3', class_='product-item__description').find(text=True, recursive=False).strip()
+        product_link = product['link']
 
         product_page = self.get_response(product_link)
         product_soup = BeautifulSoup(product_page.content, 'html.parser')
 
-        # get product details
-        product_id = product_soup.find(itemprop='sku')['content']
-        product_details = product_soup.find('ul', class_='list-column qa-description-bullet-points-list').find_all('li')
-        product_attributes = []
-        for detail in product_details:
-            product_attributes.append(detail.text.strip())
-
-        # get product images
-        product_gallery = product_soup.find('ul', class_='gallery-thumbs')
-        img_links = []
-        for img_thumb in product_gallery.find_all('li'):
-            img_src = img_thumb.find('img')['data-src']
-            img_link = 'https:' + ','.join(img_src.split(',')[:-1])+ '.jpg'
-            img_link = img_link.split('.jpg')[0] + ',{}.jpg'.format(self.image_width)
-            img_links.append(img_link)
+        try:
+            # get product details
+            product_id = product_soup.find(itemprop='sku')['content']
+            product_details = product_soup.find('ul', class_='list-column qa-description-bullet-points-list').find_all('li')
+            product_attributes = []
+            for detail in product_details:
+                product_attributes.append(detail.text.strip())
+
+            # get product images
+            product_gallery = product_soup.find('ul', class_='gallery-thumbs')
+            img_links = []
+            for img_thumb in product_gallery.find_all('li'):
+                img_src = img_thumb.find('img')['data-src']
+                img_link = 'https:' + ','.join(img_src.split(',')[:-1])+ '.jpg'
+                img_link = img_link.split('.jpg')[0] + ',{}.jpg'.format(self.image_width)
+                img_links.append(img_link)
+        finally:
+            self.release_soup(product_soup)
 
         product_img_link = img_links.pop(0)
 
-        return {'name': product_name,
-                'brand': product_brand,
+        return {'name': product['name'],
+                'brand': product['brand'],
                 'id': product_id,
                 'img_url': product_img_link,
                 'product_url': product_link,
@@ -111,19 +125,20 @@ class FashionIdScraper(Scraper):
 
     def download_products(self, url):
         """
-        Download all the product html from the category page
+        Download the category page and yield the record of each product on it. The page html is
+        decomposed before the first record is yielded.
         :param url: URL to the category website
-        :return: HTML for all the products on the website
+        :return: generator of product records
         """
 
         products_page = self.get_response(url)
         products_soup = BeautifulSoup(products_page.content, 'html.parser')
 
-        products_wrapper = products_soup.find('div', class_='prvWrapper qa-prv-wrapper')
-        products = products_wrapper.find_all('div', class_='product-item qa-product-item')
-
-        return products
-
-
-
+        try:
+            products_wrapper = products_soup.find('div', class_='prvWrapper qa-prv-wrapper')
+            products = products_wrapper.find_all('div', class_='product-item qa-product-item')
+            records = self.get_product_records(products)
+        finally:
+            self.release_soup(products_soup)
 
+        yield from records
@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import hashlib
+import threading
+
+
+class ImageStore(object):
+    """
+    Content-addressed store for downloaded images. Each image is saved only once as a blob named by the
+    hash of its content, and the image paths in the dataset are links to the blobs. A small sqlite index
+    maps the source URLs to their blobs, so images that are already stored are not downloaded again.
+    Blobs are read-only, since writing to an image path would change the image in every path linking to it;
+    images have to be copied before they can be processed in place.
+    """
+
+    def __init__(self, store_path):
+        """
+        :param store_path: path where to save the blobs and the index
+        """
+
+        self.store_path = store_path
+        self.blobs_path = os.path.join(self.store_path, 'blobs')
+        if not os.path.exists(self.blobs_path):
+            os.makedirs(self.blobs_path)
+
+        self.conn = sqlite3.connect(os.path.join(self.store_path, 'images.db'))
+        self.conn.execute('CREATE TABLE IF NOT EXISTS images '
+                          '(url TEXT, width INTEGER, blob TEXT, PRIMARY KEY (url, width))')
+
+    def get(self, url, width):
+        """
+        Get the stored blob of the image from the given URL.
+        :param url: URL of the image
+        :param width: width of the stored image
+        :return: path to the blob or None if the image is not stored yet
+        """
+
+        row = self.conn.execute('SELECT blob FROM images WHERE url = ? AND width = ?', (url, width)).fetchone()
+        if row is not None:
+            blob_path = self.get_blob_path(row[0])
+            if os.path.exists(blob_path):
+                return blob_path
+
+        return None
+
+    def put(self, url, width, content, encode):
+        """
+        Store the downloaded image. If the same content was already stored from another URL,
+        the existing blob is reused and the image is not encoded again.
+        :param url: URL of the image
+        :param width: width of the stored image
+        :param content: downloaded bytes of the image
+        :param encode: function saving the image content to the given file path in the given width
+        :return: path to the blob
+        """
+
+        blob = hashlib.sha1(content + str(width).encode('utf-8')).hexdigest()
+        blob_path = self.get_blob_path(blob)
+
+        if not os.path.exists(blob_path):
+            blob_folder = os.path.dirname(blob_path)
+            if not os.path.exists(blob_folder):
+                os.makedirs(blob_folder)
+
+            # write to a temporary file first, so that an interrupted encode doesn't leave a broken blob
+            tmp_path = '{}.{}.{}.tmp'.format(blob_path, os.getpid(), threading.get_ident())
+            encode(content, tmp_path, width)
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, blob_path)
+
+        with self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO images VALUES (?, ?, ?)', (url, width, blob))
+
+        return blob_path
+
+    def get_blob_path(self, blob):
+        return os.path.join(self.blobs_path, blob[:2], blob + '.jpg')
+
+    @staticmethod
+    def link(blob_path, img_filepath):
+        """
+        Create the image file path as a hardlink to the blob, or as a symlink if hardlinks are not supported.
+        :param blob_path: path to the blob
+        :param img_filepath: path where the image is referenced in the dataset
+        """
+
+        try:
+            os.link(blob_path, img_filepath)
+        except OSError:
+            os.symlink(os.path.relpath(blob_path, os.path.dirname(img_filepath)), img_filepath)
+
+    def close(self):
+        self.conn.close()
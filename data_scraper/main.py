@@ -1,14 +1,30 @@
 import os
 import argparse
-from aboutyou_scraper import AboutYouScraper
-from fashionid_scraper import FashionIdScraper
-from zalando_scraper import ZalandoScraper
+import importlib
 
 DATA_PATH = './data/'
 CHROMEDRIVER_PATH = '../chromedriver/chromedriver'
 
 IMAGE_WIDTH = 400
 
+# module, class name and whether it needs chromedriver for each website. The scraper module is
+# imported only for the website that is scraped, so that its dependencies are not loaded otherwise.
+SCRAPERS = {'aboutyou': ('aboutyou_scraper', 'AboutYouScraper', True),
+            'fashionid': ('fashionid_scraper', 'FashionIdScraper', False),
+            'zalando': ('zalando_scraper', 'ZalandoScraper', True)}
+
+
+def get_scraper_class(website):
+    """
+    Import the scraper class of the given website.
+    :param website: name of the website
+    :return: scraper class and whether it needs chromedriver
+    """
+
+    module_name, class_name, uses_browser = SCRAPERS[website]
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name), uses_browser
+
 
 def main(config):
 
@@ -17,7 +33,8 @@ def main(config):
 
     options = dict(data_path=config.data_path,
                    img_width=config.img_width,
-                   download_imgs=config.download_imgs)
+                   download_imgs=config.download_imgs,
+                   image_store_path=config.image_store_path)
 
     if config.color_names:
         color_names = [str(item) for item in config.color_names.split(',')]
@@ -27,17 +44,11 @@ def main(config):
         categories = [str(item) for item in config.categories.split(',')]
         options['categories'] = categories
 
-    scraper = None
-
-    if config.website == 'aboutyou':
-        options['chromedriver_path'] = config.chromedriver_path
-        scraper = AboutYouScraper(**options)
-    elif config.website == 'fashionid':
-        scraper = FashionIdScraper(**options)
-    elif config.website == 'zalando':
+    scraper_class, uses_browser = get_scraper_class(config.website)
+    if uses_browser:
         options['chromedriver_path'] = config.chromedriver_path
-        scraper = ZalandoScraper(**options)
 
+    scraper = scraper_class(**options)
     scraper.download_data()
 
 
@@ -45,7 +56,7 @@ if __name__ == '__main__':
 
     parser = argparse.ArgumentParser()
 
-    parser.add_argument('--website', type=str, default='aboutyou', choices=['aboutyou', 'fashionid', 'zalando'],
+    parser.add_argument('--website', type=str, default='aboutyou', choices=sorted(SCRAPERS.keys()),
                         help='which website to scrape')
 
     parser.add_argument('--data_path', type=str, default=DATA_PATH)
@@ -59,6 +70,8 @@ if __name__ == '__main__':
     parser.add_argument("--categories", required=False, type=str,
                         help="comma separated list of category names, e.g.: kleider,jumpsuits-und-overalls,tops "
                              "(special characters need to be replaced according to the url)")
+    parser.add_argument('--image_store_path', type=str, required=False,
+                        help='path of the image store, to share one store between websites (default: DATA_PATH/image_store)')
     parser.add_argument('--download', dest='download_imgs', action='store_true')
     parser.add_argument('--no_download', dest='download_imgs', action='store_false')
     parser.set_defaults(download_imgs=True)
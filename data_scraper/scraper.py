@@ -1,10 +1,10 @@
 import requests
-import pandas as pd
 import time
 import os
 from abc import ABCMeta, abstractmethod
-from PIL import Image
 import io
+from bs4.element import Tag
+from image_store import ImageStore
 
 
 class Scraper(object, metaclass=ABCMeta):
@@ -38,13 +38,15 @@ class Scraper(object, metaclass=ABCMeta):
                  img_width,
                  colors,
                  categories,
-                 download_imgs):
+                 download_imgs,
+                 image_store_path=None):
         """
         :param data_path: path where to save the scraped data
         :param colors: dictionary with colors and their codes for filtering
         :param categories: list of categories to scrape
         :param img_width: width of the image to be downloaded
         :param download_imgs: download pictures to the machine or just data
+        :param image_store_path: path of the image store, by default in the data path (optional)
         """
 
         self.data_path = data_path
@@ -56,6 +58,14 @@ class Scraper(object, metaclass=ABCMeta):
         self.image_width = img_width
         self.download_images = download_imgs
 
+        # images are saved once in the store and linked into the category folders
+        if image_store_path is None:
+            image_store_path = os.path.join(self.data_path, 'image_store')
+
+        self.image_store = None
+        if self.download_images:
+            self.image_store = ImageStore(image_store_path)
+
     def download_data(self):
         """
         Download all data and save the description in data.csv. The flow is the following:
@@ -64,11 +74,15 @@ class Scraper(object, metaclass=ABCMeta):
                 ->for each page: download all products and save their images and descriptions
         """
 
-        for category in self.categories:
-            try:
-                self.download_category(category)
-            except Exception as e:
-                print('Problem with download of category: {}'.format(category), e)
+        try:
+            for category in self.categories:
+                try:
+                    self.download_category(category)
+                except Exception as e:
+                    print('Problem with download of category: {}'.format(category), e)
+        finally:
+            if self.image_store is not None:
+                self.image_store.close()
 
     def download_category(self, category):
         """
@@ -120,7 +134,7 @@ class Scraper(object, metaclass=ABCMeta):
         category_color_link = self.url_category_color.format(category=category, color=self.colors[color])
         page_link = category_color_link + '&' + self.url_page_extension + '={}'.format(page)
 
-        # get the products list from the page
+        # the products are streamed as plain records, the page html is already released
         products = self.download_products(page_link)
 
         # get information for each product
@@ -150,23 +164,75 @@ class Scraper(object, metaclass=ABCMeta):
             # sleeep after each product
             time.sleep(0.5)
 
+    @abstractmethod
+    def get_product_record(self, product):
+        """
+        Get the information of the product that is available on the category page, such as the link to the product.
+        The record must only hold plain strings, so that it doesn't keep the page html alive.
+        :param product: html object from the products_soup
+        :return: dictionary with the product information
+        """
+        raise NotImplementedError
+
+    def get_product_records(self, products):
+        """
+        Get the records of all products on the category page. Products which can't be read are skipped.
+        :param products: list of html objects from the products_soup
+        :return: list of product records
+        """
+
+        records = []
+        for product in products:
+            try:
+                records.append(self.get_product_record(product))
+            except Exception as e:
+                print('Problem with reading product: ', e)
+
+        return records
+
     @abstractmethod
     def get_product_info(self, product):
         """
         Get all the information of the product, such as description, name and url to the image.
-        :param product: html object from the product_soup
+        :param product: product record from the category page
         :return: name of the product, unique image ID, url to the image, list of image tags
         """
         raise NotImplementedError
 
     def save_product_image(self, img_link, img_filepath, img_width):
         """
-        Save the given image from the url to the given image file path.
+        Save the given image from the url to the given image file path. The image is downloaded
+        only if it is not in the image store yet and the file path is linked to the stored image.
         :param img_link: URL of the image
         :param img_filepath: path where to save the image
         :param img_width: width size of the image
         """
 
+        if os.path.exists(img_filepath):
+            print('Image file already exists: ', img_filepath)
+            return
+
+        blob_path = self.image_store.get(img_link, img_width)
+        if blob_path is None:
+            img_data = self.get_response(img_link)
+            if img_data.status_code == requests.codes.ok:
+                blob_path = self.image_store.put(img_link, img_width, img_data.content, self.encode_image)
+
+        if blob_path is not None:
+            self.image_store.link(blob_path, img_filepath)
+
+    @staticmethod
+    def encode_image(img_content, img_filepath, img_width):
+        """
+        Resize the downloaded image to the given width and save it as jpeg without alpha channel.
+        :param img_content: downloaded bytes of the image
+        :param img_filepath: path where to save the image
+        :param img_width: width size of the image
+        """
+
+        # PIL is only needed when images are downloaded
+        from PIL import Image
+
         def convert_rgba(img):
             img.load()  # required for png.split()
             image_jpeg = Image.new("RGB", img.size, (255, 255, 255))
@@ -178,21 +244,17 @@ class Scraper(object, metaclass=ABCMeta):
             new_size = [img_width, int(img_width / img_ratio)]
             return(img.resize(new_size, Image.ANTIALIAS))
 
-        if not os.path.exists(img_filepath):
-            img_data = self.get_response(img_link)
-            if img_data.status_code == requests.codes.ok:
-                img = Image.open(io.BytesIO(img_data.content)).convert("RGBA")
-                img = convert_rgba(resize_image(img))
-                img.save(img_filepath)
-        else:
-            print('Image file already exists: ', img_filepath)
+        img = Image.open(io.BytesIO(img_content)).convert("RGBA")
+        img = convert_rgba(resize_image(img))
+        img.save(img_filepath, 'JPEG')
 
     @abstractmethod
     def download_products(self, url):
         """
-        Download all the product html from the category page
+        Download the category page and yield the record of each product on it. The page html is
+        released with release_soup before the first record is yielded.
         :param url: URL to the category website
-        :return: HTML for all the products on the website
+        :return: generator of product records
         """
         raise NotImplementedError
 
@@ -203,6 +265,10 @@ class Scraper(object, metaclass=ABCMeta):
         :param csv_file: Path of the csv file
         :param df: Dataframe to append/write
         """
+
+        # pandas is imported here, so that it's not loaded on startup
+        import pandas as pd
+
         try:
             df_to_save = pd.DataFrame()
 
@@ -228,6 +294,21 @@ class Scraper(object, metaclass=ABCMeta):
         if iteration == total:
             print()
 
+    @staticmethod
+    def release_soup(soup):
+        """
+        Decompose the parsed page, so that its tree is freed right away instead of waiting for the garbage collector.
+        The soup object itself is not linked to its elements, therefore each top level tag is decomposed first.
+        Top level strings, such as the doctype or line breaks, can't be decomposed and are only extracted.
+        """
+
+        for element in list(soup.contents):
+            if isinstance(element, Tag):
+                element.decompose()
+            else:
+                element.extract()
+        soup.decompose()
+
     @staticmethod
     def get_response(url):
         """
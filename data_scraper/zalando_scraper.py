@@ -1,6 +1,5 @@
 from scraper import Scraper
 from bs4 import BeautifulSoup
-from selenium import webdriver
 
 class ZalandoScraper(Scraper):
 
@@ -33,12 +32,14 @@ class ZalandoScraper(Scraper):
                  img_width,
                  download_imgs,
                  color_names=list(COLORS.keys()),
-                 categories=CATEGORIES):
+                 categories=CATEGORIES,
+                 image_store_path=None):
         """
         :param data_path: path where to save the scraped data
         :param chromedriver_path: path to chromedriver
         :param color_names: list of color names to scrape (optional)
         :param categories: list of categories to scrape (optional)
+        :param image_store_path: path of the image store, by default in the data path (optional)
         :param img_format: format in which scraped images should be saved
         """
 
@@ -48,11 +49,26 @@ class ZalandoScraper(Scraper):
         colors = {color_name: self.COLORS[color_name] for color_name in color_names}
         categories = categories
 
-        options = webdriver.ChromeOptions()
-        # options.add_argument('headless')
-        self.driver = webdriver.Chrome(chromedriver_path, chrome_options=options)
+        # chrome is started only when the first listing page is downloaded
+        self.chromedriver_path = chromedriver_path
+        self._driver = None
 
-        super().__init__(data_path, img_width, colors, categories, download_imgs)
+        super().__init__(data_path, img_width, colors, categories, download_imgs, image_store_path)
+
+    @property
+    def driver(self):
+        """
+        Chrome driver for downloading the category listing pages, started on first use.
+        """
+
+        if self._driver is None:
+            from selenium import webdriver
+
+            options = webdriver.ChromeOptions()
+            # options.add_argument('headless')
+            self._driver = webdriver.Chrome(self.chromedriver_path, chrome_options=options)
+
+        return self._driver
 
     def get_number_of_pages(self, url):
         """
@@ -72,41 +88,53 @@ class ZalandoScraper(Scraper):
 
         return max_page
 
+    def get_product_record(self, product):
+        """
+        Get the information of the product that is available on the category page.
+        :param product: html object from the products_soup
+        :return: link of the product
+        """
+
+        return {'link': self.url + product.a['href']}
+
     def get_product_info(self, product):
         """
         Get all the information of the product, such as description, name and url to the image.
-        :param product: html object from the product_soup
+        :param product: product record from the category page
         :return: name of the product, unique image ID, url to the image, image tags
         """
 
-        product_link = self.url + product.a['href']
+        product_link = product['link']
         product_page = self.get_response(product_link)
         product_soup = BeautifulSoup(product_page.content, 'html.parser')
 
-        # get product details
-        product_brand = product_soup.find('h2').text.strip()
-        product_name = product_soup.find('h1').text.strip()
-
-        product_details = product_soup.find('div', id='z-pdp-detailsSection')
-
-        product_attributes = []
-        for detail_section in product_details.find_all('div', class_='h-container h-flex-no-shrink h-tabs__panel h-align-left'):
-            for tag in detail_section.find_all('p'):
-                product_attributes.append(tag.text.strip())
-
-        # get product image
-        product_img_thumbs = product_soup.find('div', id='z-pdp-topSection')
-        product_img_thumbs = product_img_thumbs.find(
-            'div', class_='h-container h-carousel h-carousel-thumbnail vertical h-align-left')
-
-        img_links = []
-        product_img_link = ''
-        for img_thumb in product_img_thumbs.find_all('picture'):
-            img_link = img_thumb.find('img')['src'].replace('thumb', 'zoom')
-            if 'packshot' in img_link:
-                product_img_link = img_link
-            else:
-                img_links.append(img_link)
+        try:
+            # get product details
+            product_brand = product_soup.find('h2').text.strip()
+            product_name = product_soup.find('h1').text.strip()
+
+            product_details = product_soup.find('div', id='z-pdp-detailsSection')
+
+            product_attributes = []
+            for detail_section in product_details.find_all('div', class_='h-container h-flex-no-shrink h-tabs__panel h-align-left'):
+                for tag in detail_section.find_all('p'):
+                    product_attributes.append(tag.text.strip())
+
+            # get product image
+            product_img_thumbs = product_soup.find('div', id='z-pdp-topSection')
+            product_img_thumbs = product_img_thumbs.find(
+                'div', class_='h-container h-carousel h-carousel-thumbnail vertical h-align-left')
+
+            img_links = []
+            product_img_link = ''
+            for img_thumb in product_img_thumbs.find_all('picture'):
+                img_link = img_thumb.find('img')['src'].replace('thumb', 'zoom')
+                if 'packshot' in img_link:
+                    product_img_link = img_link
+                else:
+                    img_links.append(img_link)
+        finally:
+            self.release_soup(product_soup)
 
         # product_img_link = 'https:' + product_img.split('"')[1].split('?')[0]
         product_img_id = product_img_link.split('/')[-1].split('@')[0]
@@ -120,11 +148,12 @@ class ZalandoScraper(Scraper):
 
     def download_products(self, url):
         """
-        Download all the product html from the category page
+        Download the category page and yield the record of each product on it. The page html is
+        decomposed before the first record is yielded.
         :param url: URL to the category website
-        :return: HTML for all the products on the website
+        :return: generator of product records
         """
-        products = []
+        records = []
 
         try:
             self.driver.get(url)
@@ -132,12 +161,14 @@ class ZalandoScraper(Scraper):
 
             subcat_soup = BeautifulSoup(self.driver.page_source, 'html.parser')
 
-            color_products = subcat_soup.find('z-grid', class_='cat_articles')
-            products = color_products.find_all('div', class_='cat_articleContain-1Z60A')
+            try:
+                color_products = subcat_soup.find('z-grid', class_='cat_articles')
+                products = color_products.find_all('div', class_='cat_articleContain-1Z60A')
+                records = self.get_product_records(products)
+            finally:
+                self.release_soup(subcat_soup)
 
         except Exception as e:
             print('Problem with downloading products at {}:'.format(url), e)
 
-        return products
-
-
+        yield from records
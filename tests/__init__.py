@@ -0,0 +1,3 @@
+import os
+
+SCRAPER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data_scraper')
@@ -0,0 +1,6 @@
+import sys
+
+from tests import SCRAPER_PATH
+
+# the scraper modules import each other by module name, as when running data_scraper/main.py
+sys.path.insert(0, SCRAPER_PATH)
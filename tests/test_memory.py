@@ -0,0 +1,95 @@
+import gc
+import types
+import tracemalloc
+
+import pytest
+
+import scraper
+from fashionid_scraper import FashionIdScraper
+
+# filler paragraphs making each product page as large as a real one
+PRODUCT_PAGE_FILLER = 500
+
+
+def listing_page(n_products):
+    tiles = ''.join(
+        '<div class="product-item qa-product-item">'
+        '<a href="/product-{0}">link</a>'
+        '<div class="product-item__brand qa-product-tile-brand">Brand {0}</div>'
+        '<h3 class="product-item__description">Name {0}<span>new</span></h3>'
+        '</div>'.format(idx) for idx in range(n_products))
+    return ('<!DOCTYPE html>\n<html><body><div class="prvWrapper qa-prv-wrapper">{}</div></body></html>\n'
+            .format(tiles))
+
+
+def product_page(product_id):
+    return ('<!DOCTYPE html>\n<html><body><meta itemprop="sku" content="{0}">'
+            '<ul class="list-column qa-description-bullet-points-list"><li>Länge: knielang</li><li>Rundhals</li></ul>'
+            '<ul class="gallery-thumbs">'
+            '<li><img data-src="//images.fashionid.de/{0},front,100"></li>'
+            '<li><img data-src="//images.fashionid.de/{0},model,100"></li>'
+            '</ul>{1}</body></html>\n').format(product_id, '<p class="text">lorem ipsum dolor</p>' * PRODUCT_PAGE_FILLER)
+
+
+@pytest.fixture
+def fashionid_scraper(tmp_path, monkeypatch):
+    fashionid = FashionIdScraper(data_path=str(tmp_path), img_width=400, download_imgs=False)
+    fashionid.saved_products = []
+
+    def get_response(url):
+        if '&page=' in url:
+            html = listing_page(fashionid.n_products)
+        else:
+            html = product_page(url.split('-')[-1])
+        return types.SimpleNamespace(content=html.encode('utf-8'))
+
+    monkeypatch.setattr(fashionid, 'get_response', get_response)
+    monkeypatch.setattr(fashionid, 'save_product_image', lambda *args, **kwargs: None)
+    monkeypatch.setattr(fashionid, 'append_csv_file',
+                        lambda csv_file, df: fashionid.saved_products.append(df['id']))
+    monkeypatch.setattr(scraper.time, 'sleep', lambda seconds: None)
+
+    return fashionid
+
+
+def peak_memory(fashionid, n_products, n_pages=1):
+    """
+    Download the given number of pages with the given number of products each.
+    :return: peak memory allocated during the download in bytes
+    """
+
+    fashionid.n_products = n_products
+
+    # without the garbage collector, the parse trees are only released by decompose()
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        for page in range(1, n_pages + 1):
+            fashionid.download_page('kleider', 'black', page)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    return peak
+
+
+def test_products_are_downloaded(fashionid_scraper):
+    peak_memory(fashionid_scraper, n_products=5)
+
+    assert fashionid_scraper.saved_products == [str(idx) for idx in range(5)]
+
+
+def test_peak_memory_flat_in_products(fashionid_scraper):
+    peak_small = peak_memory(fashionid_scraper, n_products=5)
+    peak_large = peak_memory(fashionid_scraper, n_products=30)
+
+    assert peak_large < 1.5 * peak_small, (peak_small, peak_large)
+
+
+def test_peak_memory_flat_in_pages(fashionid_scraper):
+    peak_single = peak_memory(fashionid_scraper, n_products=10, n_pages=1)
+    peak_multiple = peak_memory(fashionid_scraper, n_products=10, n_pages=5)
+
+    assert peak_multiple < 1.5 * peak_single, (peak_single, peak_multiple)
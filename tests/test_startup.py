@@ -0,0 +1,56 @@
+import sys
+import subprocess
+
+from tests import SCRAPER_PATH
+
+# upper bound for the cumulative import time of a scraper module, in microseconds
+MAX_IMPORT_TIME = 1000000
+
+HEAVY_MODULES = ['selenium', 'PIL', 'pandas']
+
+
+def import_time(module_name):
+    """
+    Import the module in a new interpreter with -X importtime.
+    :param module_name: name of the module to import
+    :return: cumulative import time of the module in microseconds and the list of loaded modules
+    """
+
+    code = 'import sys, {}; print(",".join(sys.modules))'.format(module_name)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=SCRAPER_PATH,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+    # lines of the report look like: "import time: self [us] | cumulative | imported package"
+    cumulative = None
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == module_name:
+            cumulative = int(fields[1])
+
+    return cumulative, result.stdout.strip().split(',')
+
+
+def test_fashionid_import_skips_heavy_modules():
+    cumulative, modules = import_time('fashionid_scraper')
+
+    for heavy_module in HEAVY_MODULES:
+        assert heavy_module not in modules
+    assert cumulative < MAX_IMPORT_TIME
+
+
+def test_main_imports_no_scraper():
+    cumulative, modules = import_time('main')
+
+    assert 'scraper' not in modules
+    assert 'bs4' not in modules
+    assert cumulative < MAX_IMPORT_TIME
+
+
+def test_zalando_driver_not_started(tmp_path):
+    from zalando_scraper import ZalandoScraper
+
+    scraper = ZalandoScraper(data_path=str(tmp_path), chromedriver_path='chromedriver',
+                             img_width=400, download_imgs=False)
+
+    assert scraper._driver is None
+    assert 'selenium' not in sys.modules